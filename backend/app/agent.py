@@ -1,38 +1,360 @@
-import os
+import re
 import json
+import time
 import asyncio
-from typing import List, Dict, Any, Optional, AsyncGenerator
+from collections import deque
+from itertools import islice
+from typing import (
+    List, Dict, Any, Optional, AsyncGenerator, AsyncIterable, Tuple, Deque,
+    NamedTuple, TypeVar, Iterator
+)
 from openai import AsyncOpenAI
+from .clients import get_openai_client
 from .models import (
     UserPreferences, ChatMessage, ToolCall, QuickReplyOption
 )
-from .tools.exa_fetcher import ExaNewsFetcher
-from .tools.summarizer import NewsSummarizer
+from .tools.exa_fetcher import ExaNewsFetcher, get_exa_fetcher
+from .tools.summarizer import NewsSummarizer, get_news_summarizer
 from .preference_collector import PreferenceCollector
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Messages kept in memory per conversation, and how many of the most
+# recent ones are replayed to OpenAI on each call.
+_MAX_HISTORY_MESSAGES = 64
+_PROMPT_HISTORY_MESSAGES = 10
 
-class NewsAgent:
-    def __init__(self):
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "OPENAI_API_KEY environment variable is required "
-                "but not found"
+# Articles fetched when a get_latest_news call gives no limit
+_DEFAULT_NEWS_LIMIT = 5
+
+# Characters of article text handed to OpenAI per news article
+_ARTICLE_CONTENT_LIMIT = 800
+
+# Static part of the system prompt, shared by every conversation.
+_SYSTEM_PROMPT = (
+    "You are a helpful news assistant that collects user "
+    "preferences and provides personalized news summaries.\n\n"
+    "Your task is to:\n"
+    "1. Collect 5 specific preferences from the user:\n"
+    "   - Tone of voice (formal, casual, or enthusiastic)\n"
+    "   - Response format (bullet points or paragraphs)\n"
+    "   - Language preference\n"
+    "   - Interaction style (concise or detailed)\n"
+    "   - News topics of interest\n\n"
+    "2. Ask for missing preferences in a natural, "
+    "conversational way\n"
+    "3. Once all preferences are collected, ALWAYS use the "
+    "available tools to fetch and summarize news when the "
+    "user asks for news\n\n"
+    "IMPORTANT: The user's preferences are now COMPLETE. "
+    "For ANY user message that is not clearly changing "
+    "preferences, you MUST:\n"
+    "1. Call the fetch_news tool with the primary topic "
+    "from their preferences\n"
+    "2. Call the summarize_news tool with the fetched "
+    "articles\n\n"
+    "Examples of messages that should trigger news fetching:\n"
+    '- "yes" (after preferences are complete)\n'
+    '- "show me news"\n'
+    '- "what\'s happening today"\n'
+    '- "latest updates"\n'
+    '- "tell me about technology news"\n'
+    "- Any general conversation should include relevant "
+    "news\n\n"
+    "You should fetch news for EVERY user message now that "
+    "preferences are complete, unless they are explicitly "
+    "changing their preferences."
+)
+
+# Keyword tables used to pick up preferences from free-form messages,
+# keyed by preference field then canonical value.
+_PREFERENCE_KEYWORDS: Dict[str, Dict[str, List[str]]] = {
+    "tone": {
+        "formal": ["formal", "professional", "serious"],
+        "casual": ["casual", "friendly", "relaxed", "chill"],
+        "enthusiastic": ["enthusiastic", "excited", "energetic", "fun"],
+    },
+    "format": {
+        "bullet points": ["bullet", "points", "list"],
+        "paragraphs": ["paragraph", "essay", "prose"],
+    },
+    "language": {
+        "English": ["english"],
+        "Spanish": ["spanish"],
+        "French": ["french"],
+        "German": ["german"],
+        "Italian": ["italian"],
+        "Portuguese": ["portuguese"],
+        "Chinese": ["chinese"],
+        "Japanese": ["japanese"],
+    },
+    "interaction_style": {
+        "concise": ["concise", "brief", "short", "quick"],
+        "detailed": ["detailed", "comprehensive", "thorough", "in-depth"],
+    },
+    "topics": {
+        "technology": [
+            "technology", "tech", "ai", "software", "computer", "innovation"
+        ],
+        "sports": [
+            "sports", "football", "basketball", "soccer", "tennis",
+            "athletics"
+        ],
+        "politics": [
+            "politics", "political", "government", "election", "policy"
+        ],
+        "science": [
+            "science", "scientific", "research", "discovery", "study"
+        ],
+        "business": [
+            "business", "finance", "economy", "market", "stocks", "trade"
+        ],
+        "entertainment": [
+            "entertainment", "movies", "music", "celebrity", "culture"
+        ],
+        "health": [
+            "health", "medicine", "wellness", "fitness", "medical"
+        ],
+    },
+}
+
+_KEYWORD_TO_PREFERENCE: Dict[str, Tuple[str, str]] = {
+    keyword: (field, value)
+    for field, values in _PREFERENCE_KEYWORDS.items()
+    for value, keywords in values.items()
+    for keyword in keywords
+}
+
+# Words, including hyphenated ones such as "in-depth". Messages are split
+# into words in one scan and each word is looked up in the inverted
+# index above, instead of trying every keyword at every position.
+_WORD_RE = re.compile(r"\w+(?:-\w+)*")
+
+
+def _keyword_candidates(message: str) -> Iterator[str]:
+    """Yield the words of a lowercased message to look up as keywords
+
+    A hyphenated word is yielded whole and then part by part, so
+    "in-depth" matches as one keyword while "AI-powered" and
+    "high-tech" still match "ai" and "tech".
+    """
+    for word in _WORD_RE.findall(message):
+        yield word
+        if "-" in word:
+            yield from word.split("-")
+
+
+# Tool definitions passed to OpenAI. Built once and shared, so it must
+# not be mutated.
+_TOOLS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_latest_news",
+            "description": (
+                "Fetch latest news articles for the specified topic. "
+                "After calling this tool, you MUST summarize the returned "
+                "articles according to the user's preferences (language, "
+                "tone, format, detail level) that are specified in the "
+                "system prompt."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "topic": {
+                        "type": "string",
+                        "description": (
+                            "The news topic to search for "
+                            "(e.g., technology, sports, politics)"
+                        )
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": (
+                            "Number of articles to fetch and summarize"
+                        ),
+                        "default": _DEFAULT_NEWS_LIMIT
+                    }
+                },
+                "required": ["topic"]
+            }
+        }
+    }
+]
+
+
+def _news_call_key(arguments: Dict[str, Any]) -> Tuple[str, Any]:
+    """Identify get_latest_news calls that would fetch the same articles"""
+    return (
+        str(arguments.get("topic", "general")).lower(),
+        arguments.get("limit", _DEFAULT_NEWS_LIMIT)
+    )
+
+
+# A question from PreferenceCollector with its quick replies built
+_PreferenceQuestion = Tuple[Dict[str, Any], List[QuickReplyOption]]
+
+T = TypeVar("T")
+
+_STREAM_END = object()
+
+
+class _ToolFunction(NamedTuple):
+    name: str
+    arguments: str
+
+
+class _StreamedToolCall(NamedTuple):
+    """Tool call assembled from stream deltas.
+
+    Mirrors the shape of the SDK's tool call objects (``.function.name``
+    and ``.function.arguments``) so _execute_tools accepts either.
+    """
+    function: _ToolFunction
+
+
+class _StreamError:
+    """Carries an exception raised while reading ahead to the consumer"""
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+async def _prefetch(
+        source: AsyncIterable[T], size: int = 8
+) -> AsyncGenerator[T, None]:
+    """Iterate over source while a background task reads ahead.
+
+    Up to size items are buffered, so the next network read overlaps
+    with whatever the consumer does with the current item.
+    """
+    queue: asyncio.Queue = asyncio.Queue(size)
+
+    async def fill():
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(_StreamError(e))
+        else:
+            await queue.put(_STREAM_END)
+
+    task = asyncio.create_task(fill())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, _StreamError):
+                raise item.error
+            yield item
+    finally:
+        task.cancel()
+
+
+class _SpeculativeFetch:
+    """News fetched for the primary topic ahead of a tool call.
+
+    Belongs to a single streamed turn, so overlapping turns of the same
+    conversation never take or cancel each other's fetch.
+    """
+
+    def __init__(self, topic: str, limit: int,
+                 task: "asyncio.Task[List[Dict[str, Any]]]"):
+        self.topic = topic
+        self.limit = limit
+        self.task: Optional["asyncio.Task[List[Dict[str, Any]]]"] = task
+
+    def take(
+            self, topic: str, limit: int
+    ) -> Optional["asyncio.Task[List[Dict[str, Any]]]"]:
+        """Hand over the fetch if it matches this call"""
+        if (self.task is None or self.limit != limit or
+                self.topic.lower() != topic.lower()):
+            return None
+        task, self.task = self.task, None
+        return task
+
+    def cancel(self):
+        """Drop the fetch if no tool call asked for it"""
+        task, self.task = self.task, None
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled() and task.exception() is not None:
+            logger.info(
+                f"Discarded failed speculative EXA fetch: {task.exception()}"
             )
 
-        logger.info(f"OpenAI API key configured: {api_key[:10]}...")
-        self.async_client = AsyncOpenAI(api_key=api_key)
 
-        self.exa_fetcher = ExaNewsFetcher()
-        self.summarizer = NewsSummarizer()
-        self.preferences = UserPreferences()
-        self.conversation_history: List[ChatMessage] = []
+class NewsAgent:
+    def __init__(self):
+        # Bumped on every preference change; keys the cached prompt
+        self._prefs_version = 0
+        self._preferences_prompt_cache: Optional[Tuple[int, str]] = None
+        self._next_question_cache: Optional[
+            Tuple[int, Optional[_PreferenceQuestion]]
+        ] = None
+        self._preferences = UserPreferences()
+        self.conversation_history: Deque[ChatMessage] = deque(
+            maxlen=_MAX_HISTORY_MESSAGES
+        )
         self.preference_collector = PreferenceCollector()
 
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """The process-wide OpenAI client"""
+        return get_openai_client()
+
+    @property
+    def exa_fetcher(self) -> ExaNewsFetcher:
+        """Shared news fetcher, created on the first tool call needing it"""
+        return get_exa_fetcher()
+
+    @property
+    def summarizer(self) -> NewsSummarizer:
+        """Shared news summarizer, created on first use"""
+        return get_news_summarizer()
+
+    @property
+    def preferences(self) -> UserPreferences:
+        return self._preferences
+
+    @preferences.setter
+    def preferences(self, value: UserPreferences):
+        # The frontend resends the preferences with every request, so
+        # only a real change invalidates the caches keyed on the version
+        if value != self._preferences:
+            self._preferences = value
+            self._prefs_version += 1
+
+    def _get_next_question(self) -> Optional[_PreferenceQuestion]:
+        """Return the next preference question and its quick replies.
+
+        Cached per preferences version. Resending unchanged preferences
+        does not bump the version, so repeated requests (for example an
+        __INIT_CONVERSATION__ after a page reload) reuse the question
+        and its QuickReplyOption objects.
+        """
+        cached = self._next_question_cache
+        if cached is not None and cached[0] == self._prefs_version:
+            return cached[1]
+
+        question = self.preference_collector.get_next_preference_question(
+            self.preferences
+        )
+        entry = None
+        if question:
+            entry = (question, [
+                QuickReplyOption.model_construct(**opt)
+                for opt in question['quick_reply_options']
+            ])
+        self._next_question_cache = (self._prefs_version, entry)
+        return entry
+
     async def process_message(
             self, message: str,
             preferences: Optional[UserPreferences] = None
@@ -41,6 +363,8 @@ class NewsAgent:
 
         Used for preference collection in streaming mode.
         """
+        # One timestamp for every message created while handling this call
+        now = time.time()
         if preferences:
             self.preferences = preferences
 
@@ -49,25 +373,19 @@ class NewsAgent:
             # Don't add this to conversation history, just trigger
             # preference collection
             if not self.preferences.is_complete():
-                next_question = (
-                    self.preference_collector.get_next_preference_question(
-                        self.preferences
-                    )
-                )
+                next_question = self._get_next_question()
                 if next_question:
-                    quick_reply_opts = [
-                        QuickReplyOption(**opt)
-                        for opt in next_question['quick_reply_options']
-                    ]
-                    response_message = ChatMessage(
+                    question, quick_reply_opts = next_question
+                    response_message = ChatMessage.model_construct(
                         role="assistant",
-                        content=next_question['message'],
+                        timestamp=now,
+                        content=question['message'],
                         quick_reply_options=quick_reply_opts,
                         is_preference_question=(
-                            next_question['is_preference_question']
+                            question['is_preference_question']
                         ),
-                        preference_type=next_question['preference_type'],
-                        selection_type=next_question['selection_type']
+                        preference_type=question['preference_type'],
+                        selection_type=question['selection_type']
                     )
                     self.conversation_history.append(response_message)
                     return response_message
@@ -77,8 +395,9 @@ class NewsAgent:
                         self.preferences
                     )
                 )
-                response_message = ChatMessage(
+                response_message = ChatMessage.model_construct(
                     role="assistant",
+                    timestamp=now,
                     content=welcome_msg
                 )
                 self.conversation_history.append(response_message)
@@ -90,32 +409,26 @@ class NewsAgent:
             parts = message.replace("PREFERENCE_SELECTION:", "").split(":")
             if len(parts) == 2:
                 pref_type, value = parts
-                self.preferences = (
-                    self.preference_collector.process_preference_response(
-                        self.preferences, pref_type, value
-                    )
+                # Updated in place, which the setter cannot detect
+                self.preference_collector.process_preference_response(
+                    self.preferences, pref_type, value
                 )
+                self._prefs_version += 1
 
                 # Check for next preference question
-                next_question = (
-                    self.preference_collector.get_next_preference_question(
-                        self.preferences
-                    )
-                )
+                next_question = self._get_next_question()
                 if next_question:
-                    quick_reply_opts = [
-                        QuickReplyOption(**opt)
-                        for opt in next_question['quick_reply_options']
-                    ]
-                    response_message = ChatMessage(
+                    question, quick_reply_opts = next_question
+                    response_message = ChatMessage.model_construct(
                         role="assistant",
-                        content=next_question['message'],
+                        timestamp=now,
+                        content=question['message'],
                         quick_reply_options=quick_reply_opts,
                         is_preference_question=(
-                            next_question['is_preference_question']
+                            question['is_preference_question']
                         ),
-                        preference_type=next_question['preference_type'],
-                        selection_type=next_question['selection_type']
+                        preference_type=question['preference_type'],
+                        selection_type=question['selection_type']
                     )
                     self.conversation_history.append(response_message)
                     return response_message
@@ -124,8 +437,9 @@ class NewsAgent:
                     completion_msg = (
                         self.preference_collector.get_completion_message()
                     )
-                    response_message = ChatMessage(
+                    response_message = ChatMessage.model_construct(
                         role="assistant",
+                        timestamp=now,
                         content=completion_msg
                     )
                     self.conversation_history.append(response_message)
@@ -135,16 +449,19 @@ class NewsAgent:
         self._extract_preferences(message)
 
         # Add user message to history
-        user_message = ChatMessage(
+        user_message = ChatMessage.model_construct(
             role="user",
             content=message,
-            timestamp=datetime.now()
+            timestamp=now
         )
         self.conversation_history.append(user_message)
 
         logger.info(f"Processing regular message: {message}")
         logger.info(f"Preferences complete: {self.preferences.is_complete()}")
-        logger.info(f"Current preferences: {self.preferences.model_dump()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Current preferences: {self.preferences.model_dump()}"
+            )
 
         # Prepare messages for OpenAI
         messages = self._prepare_messages(message)
@@ -204,15 +521,17 @@ class NewsAgent:
                     f"Generated response content length: "
                     f"{content_len} characters"
                 )
-                response_message = ChatMessage(
+                response_message = ChatMessage.model_construct(
                     role="assistant",
+                    timestamp=now,
                     content=content,
                     tool_calls=tool_results
                 )
             else:
                 logger.info("No tool calls requested by OpenAI")
-                response_message = ChatMessage(
+                response_message = ChatMessage.model_construct(
                     role="assistant",
+                    timestamp=now,
                     content=assistant_message.content or ""
                 )
                 logger.info(
@@ -232,6 +551,8 @@ class NewsAgent:
             preferences: Optional[UserPreferences] = None
     ) -> AsyncGenerator[str, None]:
         """Process message with streaming response"""
+        # One timestamp for every message created while handling this call
+        now = time.time()
         if preferences:
             self.preferences = preferences
 
@@ -239,19 +560,20 @@ class NewsAgent:
         self._extract_preferences(message)
 
         # Add user message to history
-        user_message = ChatMessage(
+        user_message = ChatMessage.model_construct(
             role="user",
             content=message,
-            timestamp=datetime.now()
+            timestamp=now
         )
         self.conversation_history.append(user_message)
 
         logger.info(f"Streaming process - message: {message}")
         logger.info(f"Preferences complete: {self.preferences.is_complete()}")
-        logger.info(
-            f"Current preferences for streaming: "
-            f"{self.preferences.model_dump()}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Current preferences for streaming: "
+                f"{self.preferences.model_dump()}"
+            )
 
         # Prepare messages for OpenAI
         messages = self._prepare_messages(message)
@@ -270,16 +592,23 @@ class NewsAgent:
             f"Streaming - Tools enabled: {tools is not None}, "
             f"Tool count: {tool_count}"
         )
+        # News fetched ahead of this turn's tool call, if any
+        speculative: Optional[_SpeculativeFetch] = None
         try:
             logger.info("Starting OpenAI streaming call...")
             if tools:
                 tool_names = [tool['function']['name'] for tool in tools]
                 logger.info(f"Tools being passed to OpenAI: {tool_names}")
-                logger.info(
-                    f"Full tool definitions: {json.dumps(tools, indent=2)}"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Full tool definitions: "
+                        f"{json.dumps(tools, indent=2)}"
+                    )
             else:
                 logger.info("No tools being passed to OpenAI")
+            # Fetch the likely news in parallel with the OpenAI call
+            if tools:
+                speculative = self._start_speculative_fetch()
             # Call OpenAI with streaming
             stream = await self.async_client.chat.completions.create(
                 model="gpt-4-turbo-preview",
@@ -292,19 +621,20 @@ class NewsAgent:
             )
             logger.info("OpenAI streaming call initiated successfully")
 
-            # Stream the response
-            accumulated_content = ""
+            # Stream the response; chunks are collected in a list and
+            # joined once at the end rather than concatenated per chunk
+            content_parts: List[str] = []
             # Track tool calls by index to properly assemble them
             tool_calls_by_index = {}
             chunk_count = 0
-            async for chunk in stream:
+            async for chunk in _prefetch(stream):
                 chunk_count += 1
                 choice = chunk.choices[0]
 
                 # Handle content streaming
                 if choice.delta.content:
                     content = choice.delta.content
-                    accumulated_content += content
+                    content_parts.append(content)
                     yield content
 
                 # Handle tool calls in streaming - need to assemble by index
@@ -316,135 +646,40 @@ class NewsAgent:
                         if index not in tool_calls_by_index:
                             tool_calls_by_index[index] = {
                                 'id': tool_call_delta.id or '',
-                                'function': {
-                                    'name': (
-                                        tool_call_delta.function.name or ''
-                                    ),
-                                    'arguments': ''
-                                },
+                                'name': tool_call_delta.function.name or '',
+                                'arg_parts': [],
                                 'type': tool_call_delta.type or 'function'
                             }
+                        tool_call = tool_calls_by_index[index]
 
                         # Accumulate data
                         if tool_call_delta.id:
-                            tool_calls_by_index[index]['id'] = (
-                                tool_call_delta.id
-                            )
+                            tool_call['id'] = tool_call_delta.id
                         if tool_call_delta.function.name:
-                            tool_calls_by_index[index]['function']['name'] = (
-                                tool_call_delta.function.name
-                            )
+                            tool_call['name'] = tool_call_delta.function.name
                         if tool_call_delta.function.arguments:
-                            current_args = (
-                                tool_calls_by_index[index]['function']
-                                ['arguments']
-                            )
-                            tool_calls_by_index[index]['function'][
-                                'arguments'
-                            ] = (
-                                current_args +
+                            tool_call['arg_parts'].append(
                                 tool_call_delta.function.arguments
                             )
-            content_len = len(accumulated_content)
+            content_len = sum(map(len, content_parts))
             logger.info(
                 f"Streaming completed: {chunk_count} chunks, "
                 f"{content_len} total characters"
             )
             logger.info(f"Assembled tool calls: {len(tool_calls_by_index)}")
-            # If we have tool calls, execute them
+            # If we have tool calls, execute them and stream the answer
             if tool_calls_by_index:
-                logger.info("Executing tools from streaming response...")
-
-                # Log the assembled tool calls
-                for index, tool_call in tool_calls_by_index.items():
-                    func_name = tool_call['function']['name']
-                    func_args = tool_call['function']['arguments']
-                    logger.info(
-                        f"Tool call {index}: {func_name} with args: "
-                        f"{func_args}"
-                    )
+                async for content in self._stream_tool_response(
+                    messages, tool_calls_by_index, speculative
+                ):
+                    content_parts.append(content)
+                    yield content
 
-                # Create mock tool call objects for execution
-                class MockToolCall:
-                    def __init__(self, name, arguments):
-                        self.function = type('obj', (object,), {
-                            'name': name,
-                            'arguments': arguments
-                        })()
-
-                regular_tool_calls = []
-                for tool_call in tool_calls_by_index.values():
-                    func_name = tool_call['function']['name']
-                    func_args = tool_call['function']['arguments']
-                    if func_name and func_args:
-                        regular_tool_calls.append(
-                            MockToolCall(func_name, func_args)
-                        )
-                if regular_tool_calls:
-                    tool_results = await self._execute_tools(
-                        regular_tool_calls
-                    )
-                    
-                    # Create messages with tool results for OpenAI to process
-                    messages_with_tools = messages.copy()
-                    
-                    # Add assistant message with tool calls
-                    messages_with_tools.append({
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": [
-                            {
-                                "id": f"call_{i}",
-                                "type": "function", 
-                                "function": {
-                                    "name": result.name,
-                                    "arguments": json.dumps(result.arguments)
-                                }
-                            }
-                            for i, result in enumerate(tool_results)
-                        ]
-                    })
-                    
-                    # Add tool results
-                    for result in tool_results:
-                        messages_with_tools.append({
-                            "role": "tool",
-                            "content": result.result,
-                            "tool_call_id": f"call_{tool_results.index(result)}"
-                        })
-                    
-                    # Get OpenAI's final response with tool results
-                    logger.info("Getting OpenAI's final response with tool results...")
-                    final_stream = await self.async_client.chat.completions.create(
-                        model="gpt-4-turbo-preview",
-                        messages=messages_with_tools,
-                        temperature=0.7,
-                        max_tokens=2000,
-                        stream=True
-                    )
-                    
-                    # Stream the final response
-                    final_chunk_count = 0
-                    try:
-                        async for chunk in final_stream:
-                            final_chunk_count += 1
-                            choice = chunk.choices[0]
-                            if choice.delta.content:
-                                content = choice.delta.content
-                                accumulated_content += content
-                                yield content
-                        
-                        logger.info(f"Final streaming completed: {final_chunk_count} chunks, {len(accumulated_content)} total characters")
-                    except Exception as e:
-                        logger.error(f"Error in final streaming: {e}")
-                        error_msg = f"Error occurred while generating response: {str(e)}"
-                        yield error_msg
-                        accumulated_content += error_msg
             # Add assistant response to conversation history
-            assistant_message = ChatMessage(
+            assistant_message = ChatMessage.model_construct(
                 role="assistant",
-                content=accumulated_content,
-                timestamp=datetime.now()
+                content="".join(content_parts),
+                timestamp=now
             )
             self.conversation_history.append(assistant_message)
         except Exception as e:
@@ -452,168 +687,151 @@ class NewsAgent:
             raise Exception(
                 f"Failed to stream message with OpenAI: {str(e)}"
             )
+        finally:
+            if speculative is not None:
+                speculative.cancel()
+
+    async def _stream_tool_response(
+            self, messages: List[Dict[str, Any]],
+            tool_calls_by_index: Dict[int, Dict[str, Any]],
+            speculative: Optional[_SpeculativeFetch] = None
+    ) -> AsyncGenerator[str, None]:
+        """Execute streamed tool calls and stream OpenAI's final answer"""
+        logger.info("Executing tools from streaming response...")
+
+        regular_tool_calls = []
+        for index, tool_call in tool_calls_by_index.items():
+            # Join the streamed argument fragments
+            func_name = tool_call['name']
+            func_args = ''.join(tool_call['arg_parts'])
+            logger.info(
+                f"Tool call {index}: {func_name} with args: {func_args}"
+            )
+            if func_name and func_args:
+                regular_tool_calls.append(
+                    _StreamedToolCall(_ToolFunction(func_name, func_args))
+                )
+        if not regular_tool_calls:
+            return
+
+        tool_results = await self._execute_tools(
+            regular_tool_calls, speculative
+        )
+
+        # Messages with the assistant tool calls and their results for
+        # OpenAI to process
+        messages_with_tools = [
+            *messages,
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{i}",
+                        "type": "function",
+                        "function": {
+                            "name": result.name,
+                            # Send back the JSON the model produced rather
+                            # than re-serializing the parsed arguments
+                            "arguments": (
+                                result.raw_arguments or
+                                json.dumps(result.arguments)
+                            )
+                        }
+                    }
+                    for i, result in enumerate(tool_results)
+                ]
+            },
+            *(
+                {
+                    "role": "tool",
+                    "content": result.result,
+                    "tool_call_id": f"call_{i}"
+                }
+                for i, result in enumerate(tool_results)
+            )
+        ]
+
+        # Get OpenAI's final response with tool results
+        logger.info("Getting OpenAI's final response with tool results...")
+        final_stream = await self.async_client.chat.completions.create(
+            model="gpt-4-turbo-preview",
+            messages=messages_with_tools,
+            temperature=0.7,
+            max_tokens=2000,
+            stream=True
+        )
+
+        # Stream the final response
+        final_chunk_count = 0
+        content_len = 0
+        try:
+            async for chunk in _prefetch(final_stream):
+                final_chunk_count += 1
+                choice = chunk.choices[0]
+                if choice.delta.content:
+                    content = choice.delta.content
+                    content_len += len(content)
+                    yield content
+
+            logger.info(
+                f"Final streaming completed: {final_chunk_count} chunks, "
+                f"{content_len} total characters"
+            )
+        except Exception as e:
+            logger.error(f"Error in final streaming: {e}")
+            yield f"Error occurred while generating response: {str(e)}"
 
     def _extract_preferences(self, message: str):
         """Extract preferences from user message."""
-        message_lower = message.lower()
-
-        # Tone detection
-        formal_words = ["formal", "professional", "serious"]
-        casual_words = ["casual", "friendly", "relaxed", "chill"]
-        enthusiastic_words = ["enthusiastic", "excited", "energetic", "fun"]
-
-        if any(word in message_lower for word in formal_words):
-            self.preferences.tone = "formal"
-        elif any(word in message_lower for word in casual_words):
-            self.preferences.tone = "casual"
-        elif any(word in message_lower for word in enthusiastic_words):
-            self.preferences.tone = "enthusiastic"
-
-        # Format detection
-        bullet_words = ["bullet", "points", "list"]
-        paragraph_words = ["paragraph", "essay", "prose"]
-
-        if any(word in message_lower for word in bullet_words):
-            self.preferences.format = "bullet points"
-        elif any(word in message_lower for word in paragraph_words):
-            self.preferences.format = "paragraphs"
-
-        # Language detection
-        languages = {
-            "english": "English",
-            "spanish": "Spanish",
-            "french": "French",
-            "german": "German",
-            "italian": "Italian",
-            "portuguese": "Portuguese",
-            "chinese": "Chinese",
-            "japanese": "Japanese"
-        }
-        for lang_key, lang_value in languages.items():
-            if lang_key in message_lower:
-                self.preferences.language = lang_value
-                break
+        detected_topics = {}
+        matched_fields = set()
+        changed = False
 
-        # Style detection
-        concise_words = ["concise", "brief", "short", "quick"]
-        detailed_words = ["detailed", "comprehensive", "thorough", "in-depth"]
-
-        if any(word in message_lower for word in concise_words):
-            self.preferences.interaction_style = "concise"
-        elif any(word in message_lower for word in detailed_words):
-            self.preferences.interaction_style = "detailed"
-
-        # Topics detection
-        topic_keywords = {
-            "technology": [
-                "technology", "tech", "ai", "software", "computer",
-                "innovation"
-            ],
-            "sports": [
-                "sports", "football", "basketball", "soccer", "tennis",
-                "athletics"
-            ],
-            "politics": [
-                "politics", "political", "government", "election", "policy"
-            ],
-            "science": [
-                "science", "scientific", "research", "discovery", "study"
-            ],
-            "business": [
-                "business", "finance", "economy", "market", "stocks",
-                "trade"
-            ],
-            "entertainment": [
-                "entertainment", "movies", "music", "celebrity", "culture"
-            ],
-            "health": [
-                "health", "medicine", "wellness", "fitness", "medical"
-            ]
-        }
-        detected_topics = []
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in message_lower for keyword in keywords):
-                detected_topics.append(topic)
+        for word in _keyword_candidates(message.lower()):
+            hit = _KEYWORD_TO_PREFERENCE.get(word)
+            if hit is None:
+                continue
+            field, value = hit
+            if field == "topics":
+                detected_topics[value] = None
+            elif field not in matched_fields:
+                # First keyword seen wins for single-valued preferences
+                matched_fields.add(field)
+                if getattr(self.preferences, field) != value:
+                    setattr(self.preferences, field, value)
+                    changed = True
 
         if detected_topics:
-            self.preferences.topics = detected_topics
+            topics = list(detected_topics)
+            if self.preferences.topics != topics:
+                self.preferences.topics = topics
+                changed = True
+
+        if changed:
+            self._prefs_version += 1
 
         logger.info(f"Extracted preferences: {self.preferences}")
 
     def _prepare_messages(self, current_message: str) -> List[Dict[str, Any]]:
         """Prepare messages for OpenAI API."""
-        # Build base system content
-        system_content = (
-            "You are a helpful news assistant that collects user "
-            "preferences and provides personalized news summaries.\n\n"
-            "Your task is to:\n"
-            "1. Collect 5 specific preferences from the user:\n"
-            "   - Tone of voice (formal, casual, or enthusiastic)\n"
-            "   - Response format (bullet points or paragraphs)\n"
-            "   - Language preference\n"
-            "   - Interaction style (concise or detailed)\n"
-            "   - News topics of interest\n\n"
-            "2. Ask for missing preferences in a natural, "
-            "conversational way\n"
-            "3. Once all preferences are collected, ALWAYS use the "
-            "available tools to fetch and summarize news when the "
-            "user asks for news\n\n"
-            "IMPORTANT: The user's preferences are now COMPLETE. "
-            "For ANY user message that is not clearly changing "
-            "preferences, you MUST:\n"
-            "1. Call the fetch_news tool with the primary topic "
-            "from their preferences\n"
-            "2. Call the summarize_news tool with the fetched "
-            "articles\n\n"
-            "Examples of messages that should trigger news fetching:\n"
-            '- "yes" (after preferences are complete)\n'
-            '- "show me news"\n'
-            '- "what\'s happening today"\n'
-            '- "latest updates"\n'
-            '- "tell me about technology news"\n'
-            "- Any general conversation should include relevant "
-            "news\n\n"
-            "You should fetch news for EVERY user message now that "
-            "preferences are complete, unless they are explicitly "
-            "changing their preferences.\n\n"
-        )
-        
-        # Add language instruction if user has selected a non-English language
-        if (self.preferences.language and 
-            self.preferences.language.lower() != "english"):
-            system_content += (
-                f"CRITICAL LANGUAGE INSTRUCTION: You MUST respond in {self.preferences.language} ONLY. "
-                f"ALL content including news summaries, greetings, and any text you generate "
-                f"must be written in {self.preferences.language}. "
-                f"When you receive news articles from tools, summarize them completely in {self.preferences.language}. "
-                f"Never use English unless the user's language preference is English.\n\n"
-            )
-        
-        # Add tool usage instructions
-        system_content += (
-            "TOOL USAGE: When you call get_latest_news and receive article data, "
-            "you must create a complete news summary based on the user's preferences:\n"
-            f"- Tone: {self.preferences.tone}\n"
-            f"- Format: {self.preferences.format}\n" 
-            f"- Language: {self.preferences.language}\n"
-            f"- Detail level: {self.preferences.interaction_style}\n"
-            "Create a well-formatted summary with headlines, content, and links.\n\n"
-        )
-        
-        system_content += (
-            "Current preferences collected:\n"
-            f"{self.preferences.model_dump()}"
-        )
-        
+        # The static prompt goes first so it stays a stable, cacheable
+        # prefix; the preference-dependent part follows separately.
         messages = [
             {
                 "role": "system",
-                "content": system_content
+                "content": _SYSTEM_PROMPT
+            },
+            {
+                "role": "system",
+                "content": self._get_preferences_prompt()
             }
         ]
 
-        # Add conversation history (limit to last 10 messages)
-        for msg in self.conversation_history[-10:]:
+        # Add conversation history (limit to the most recent messages)
+        history = self.conversation_history
+        start = max(0, len(history) - _PROMPT_HISTORY_MESSAGES)
+        for msg in islice(history, start, None):
             messages.append({
                 "role": msg.role,
                 "content": msg.content
@@ -627,47 +845,65 @@ class NewsAgent:
 
         return messages
 
+    def _get_preferences_prompt(self) -> str:
+        """Return the preference-dependent system prompt.
+
+        Rebuilt only when the preferences have changed since last call.
+        """
+        cached = self._preferences_prompt_cache
+        if cached is not None and cached[0] == self._prefs_version:
+            return cached[1]
+
+        preferences = self.preferences
+        content = ""
+
+        # Add language instruction if user has selected a non-English language
+        if (preferences.language and
+                preferences.language.lower() != "english"):
+            content += (
+                f"CRITICAL LANGUAGE INSTRUCTION: You MUST respond in "
+                f"{preferences.language} ONLY. "
+                f"ALL content including news summaries, greetings, and any "
+                f"text you generate must be written in "
+                f"{preferences.language}. "
+                f"When you receive news articles from tools, summarize them "
+                f"completely in {preferences.language}. "
+                f"Never use English unless the user's language preference "
+                f"is English.\n\n"
+            )
+
+        # Add tool usage instructions
+        content += (
+            "TOOL USAGE: When you call get_latest_news and receive article "
+            "data, you must create a complete news summary based on the "
+            "user's preferences:\n"
+            f"- Tone: {preferences.tone}\n"
+            f"- Format: {preferences.format}\n"
+            f"- Language: {preferences.language}\n"
+            f"- Detail level: {preferences.interaction_style}\n"
+            "Create a well-formatted summary with headlines, content, "
+            "and links.\n\n"
+            "Current preferences collected:\n"
+            f"{preferences.model_dump()}"
+        )
+
+        self._preferences_prompt_cache = (self._prefs_version, content)
+        return content
+
     def _get_available_tools(self) -> List[Dict[str, Any]]:
         """Return tool definitions for OpenAI"""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_latest_news",
-                    "description": (
-                        "Fetch latest news articles for the specified topic. "
-                        "After calling this tool, you MUST summarize the returned articles "
-                        "according to the user's preferences (language, tone, format, detail level) "
-                        "that are specified in the system prompt."
-                    ),
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "topic": {
-                                "type": "string",
-                                "description": (
-                                    "The news topic to search for "
-                                    "(e.g., technology, sports, politics)"
-                                )
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": (
-                                    "Number of articles to fetch and summarize"
-                                ),
-                                "default": 5
-                            }
-                        },
-                        "required": ["topic"]
-                    }
-                }
-            }
-        ]
+        return _TOOLS
 
-    async def _execute_tools(self, tool_calls) -> List[ToolCall]:
-        """Execute tool calls and return results."""
-        results = []
+    async def _execute_tools(
+            self, tool_calls,
+            speculative: Optional[_SpeculativeFetch] = None
+    ) -> List[ToolCall]:
+        """Execute tool calls and return results.
 
+        News fetches for all calls run concurrently, and calls asking
+        for the same topic and limit share a single fetch.
+        """
+        news_calls = []
         for i, tool_call in enumerate(tool_calls):
             function_name = tool_call.function.name
             arguments = json.loads(tool_call.function.arguments)
@@ -677,54 +913,113 @@ class NewsAgent:
                 f"with args: {arguments}"
             )
             if function_name == "get_latest_news":
-                topic = arguments.get("topic", "general")
-                limit = arguments.get("limit", 5)
-                logger.info(
-                    f"Getting latest news for topic '{topic}' "
-                    f"with limit {limit}"
-                )
-                try:
-                    # Fetch articles from EXA API
-                    logger.info("Fetching articles from EXA API...")
-                    articles = self.exa_fetcher.fetch(
-                        topic=topic, limit=limit
-                    )
-                    article_count = len(articles)
-                    logger.info(
-                        f"Successfully fetched {article_count} articles "
-                        f"from EXA API"
-                    )
-                    
-                    # Format articles for OpenAI to summarize
-                    articles_text = f"Here are {article_count} news articles about {topic}:\n\n"
-                    for i, article in enumerate(articles, 1):
-                        title = article.get('title', 'Untitled')
-                        content = article.get('content', '')[:800]  # Limit content
-                        url = article.get('url', '')
-                        date = article.get('published_date', '')
-                        
-                        articles_text += f"**Article {i}: {title}**\n"
-                        articles_text += f"Content: {content}\n"
-                        if url:
-                            articles_text += f"URL: {url}\n"
-                        if date:
-                            articles_text += f"Published: {date}\n"
-                        articles_text += "\n---\n\n"
-                    
-                    # Log summary
-                    logger.info(f"Prepared {article_count} articles for OpenAI summarization")
-                    
-                    results.append(ToolCall(
-                        name="get_latest_news",
-                        arguments=arguments,
-                        result=articles_text
-                    ))
-                except Exception as e:
-                    logger.error(f"Error in get_latest_news tool: {e}")
-                    raise
+                news_calls.append((arguments, tool_call.function.arguments))
+
+        unique_calls: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        for arguments, _ in news_calls:
+            unique_calls.setdefault(_news_call_key(arguments), arguments)
+        # The fetcher bounds concurrent Exa requests process-wide
+        article_lists = await asyncio.gather(*(
+            self._fetch_news(arguments, speculative)
+            for arguments in unique_calls.values()
+        ))
+        articles_by_key = dict(zip(unique_calls, article_lists))
+
+        results = []
+        for arguments, raw_arguments in news_calls:
+            articles = articles_by_key[_news_call_key(arguments)]
+            topic = arguments.get("topic", "general")
+            article_count = len(articles)
+
+            # Format articles for OpenAI to summarize; content is already
+            # capped at _ARTICLE_CONTENT_LIMIT by the fetcher
+            parts = [
+                f"Here are {article_count} news articles about {topic}:\n\n"
+            ]
+            for j, article in enumerate(articles, 1):
+                title = article.get('title', 'Untitled')
+                url = article.get('url', '')
+                date = article.get('published_date', '')
+
+                parts.append(f"**Article {j}: {title}**\n")
+                parts.append(f"Content: {article.get('content', '')}\n")
+                if url:
+                    parts.append(f"URL: {url}\n")
+                if date:
+                    parts.append(f"Published: {date}\n")
+                parts.append("\n---\n\n")
+            articles_text = "".join(parts)
+
+            # Log summary
+            logger.info(
+                f"Prepared {article_count} articles for OpenAI "
+                f"summarization"
+            )
+
+            results.append(ToolCall(
+                name="get_latest_news",
+                arguments=arguments,
+                raw_arguments=raw_arguments,
+                result=articles_text
+            ))
 
         return results
 
+    async def _fetch_news(
+            self, arguments: Dict[str, Any],
+            speculative: Optional[_SpeculativeFetch] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch articles for one get_latest_news call"""
+        topic = arguments.get("topic", "general")
+        limit = arguments.get("limit", _DEFAULT_NEWS_LIMIT)
+        logger.info(
+            f"Getting latest news for topic '{topic}' "
+            f"with limit {limit}"
+        )
+        try:
+            task = speculative.take(topic, limit) if speculative else None
+            if task is not None:
+                logger.info("Using speculative EXA fetch for this call")
+                articles = await task
+            else:
+                # Fetch articles from EXA API
+                logger.info("Fetching articles from EXA API...")
+                articles = await self._fetch_articles(topic, limit)
+        except Exception as e:
+            logger.error(f"Error in get_latest_news tool: {e}")
+            raise
+        logger.info(
+            f"Successfully fetched {len(articles)} articles "
+            f"from EXA API"
+        )
+        return articles
+
+    async def _fetch_articles(
+            self, topic: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch articles from EXA"""
+        return await self.exa_fetcher.fetch(
+            topic=topic,
+            limit=limit,
+            content_limit=_ARTICLE_CONTENT_LIMIT
+        )
+
+    def _start_speculative_fetch(self) -> Optional[_SpeculativeFetch]:
+        """Start fetching news for the primary topic ahead of OpenAI.
+
+        Once preferences are complete the system prompt tells the model
+        to call get_latest_news with the primary topic, so the EXA round
+        trip can overlap with the model's response instead of following
+        it.
+        """
+        if not self.preferences.is_complete():
+            return None
+        topic = self.preferences.topics[0]
+        task = asyncio.create_task(
+            self._fetch_articles(topic, _DEFAULT_NEWS_LIMIT)
+        )
+        return _SpeculativeFetch(topic, _DEFAULT_NEWS_LIMIT, task)
+
     def _format_tool_response(self, tool_results: List[ToolCall]) -> str:
         """Format tool results into a response."""
         result_count = len(tool_results)
@@ -0,0 +1,60 @@
+import os
+import logging
+from typing import Optional
+import aiohttp
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+logger = logging.getLogger(__name__)
+
+# Process-wide clients, shared by every conversation so connections
+# (and their TLS sessions) are pooled and reused between requests.
+_openai_client: Optional[AsyncOpenAI] = None
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client, creating it on first use"""
+    global _openai_client
+    if _openai_client is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "OPENAI_API_KEY environment variable is required "
+                "but not found"
+            )
+        _openai_client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50
+                )
+            )
+        )
+        logger.info("Created shared OpenAI client")
+    return _openai_client
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session used for EXA requests"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=16)
+        )
+        logger.info("Created shared HTTP session")
+    return _http_session
+
+
+async def close_clients():
+    """Close the shared clients; called on application shutdown"""
+    global _openai_client, _http_session
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
+        logger.info("Closed shared HTTP session")
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
+        logger.info("Closed shared OpenAI client")
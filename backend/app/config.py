@@ -1,27 +1,29 @@
-import os
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
+# The OpenAI and EXA clients read their keys with os.getenv, so the
+# .env file is still loaded into the process environment.
 load_dotenv()
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
+
     # API Keys
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
-    exa_api_key: str = os.getenv("EXA_API_KEY", "")
+    openai_api_key: str = ""
+    exa_api_key: str = ""
 
     # Environment
-    environment: str = os.getenv("ENVIRONMENT", "development")
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    environment: str = "development"
+    log_level: str = "INFO"
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3000",
                                "http://localhost:3001"]
 
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-
-
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the application settings, loading them on first use"""
+    return Settings()
@@ -1,10 +1,14 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
-from .config import settings
+from .config import get_settings
+from .clients import close_clients
 from .routers import chat
 
+settings = get_settings()
+
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.log_level),
@@ -21,11 +25,13 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down...")
+    await close_clients()
 
 app = FastAPI(
     title="Latest News Agent API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     description="AI-powered news chat assistant with preference collection"
 )
 
@@ -1,6 +1,12 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 from typing import Optional, List, Literal, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
+import time
+
+
+def _epoch_to_iso(timestamp: float) -> str:
+    """Format a Unix timestamp as an ISO 8601 UTC string"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
 
 
 class UserPreferences(BaseModel):
@@ -11,15 +17,15 @@ class UserPreferences(BaseModel):
     topics: Optional[List[str]] = None
 
     def is_complete(self) -> bool:
-        return all([
-            self.tone is not None,
-            self.format is not None,
-            self.language is not None,
-            self.interaction_style is not None,
-            self.topics is not None and len(self.topics) > 0
-        ])
+        return (self.tone is not None and
+                self.format is not None and
+                self.language is not None and
+                self.interaction_style is not None and
+                bool(self.topics))
 
     def get_missing_preferences(self) -> List[str]:
+        if self.is_complete():
+            return []
         missing = []
         if self.tone is None:
             missing.append("tone of voice (formal, casual, or enthusiastic)")
@@ -37,6 +43,8 @@ class UserPreferences(BaseModel):
 class ToolCall(BaseModel):
     name: str
     arguments: Dict[str, Any]
+    # Arguments exactly as received from OpenAI, for echoing back to it
+    raw_arguments: Optional[str] = Field(default=None, exclude=True)
     result: Optional[Any] = None
 
 
@@ -48,13 +56,19 @@ class QuickReplyOption(BaseModel):
 class ChatMessage(BaseModel):
     role: Literal["user", "assistant", "system"]
     content: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    # Timestamps are stored as Unix time and rendered as ISO 8601 only
+    # when the model is serialized
+    timestamp: float = Field(default_factory=time.time)
     tool_calls: Optional[List[ToolCall]] = None
     quick_reply_options: Optional[List[QuickReplyOption]] = None
     is_preference_question: bool = False
     preference_type: Optional[str] = None
     selection_type: Optional[Literal["single", "multiple"]] = None
 
+    @field_serializer('timestamp')
+    def _serialize_timestamp(self, timestamp: float) -> str:
+        return _epoch_to_iso(timestamp)
+
 
 class ChatRequest(BaseModel):
     message: str
@@ -75,11 +89,19 @@ class Session(BaseModel):
     conversation_id: str
     messages: List[ChatMessage]
     preferences: Optional[UserPreferences]
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: float = Field(default_factory=time.time)
+    updated_at: float = Field(default_factory=time.time)
+
+    @field_serializer('created_at', 'updated_at')
+    def _serialize_timestamp(self, timestamp: float) -> str:
+        return _epoch_to_iso(timestamp)
 
 
 class ErrorResponse(BaseModel):
     detail: str
     status_code: int
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: float = Field(default_factory=time.time)
+
+    @field_serializer('timestamp')
+    def _serialize_timestamp(self, timestamp: float) -> str:
+        return _epoch_to_iso(timestamp)
@@ -64,6 +64,19 @@ class PreferenceCollector:
         'tone', 'format', 'language', 'interaction_style', 'topics'
     ]
 
+    # The questions are static, so the messages handed out for them are
+    # built once here. Callers must treat them as read-only.
+    _PREBUILT_QUESTIONS = {
+        pref_key: {
+            'message': question_data['question'],
+            'quick_reply_options': question_data['options'],
+            'preference_type': pref_key,
+            'selection_type': question_data['type'],
+            'is_preference_question': True
+        }
+        for pref_key, question_data in PREFERENCE_QUESTIONS.items()
+    }
+
     def get_next_preference_question(
             self, preferences: UserPreferences
     ) -> Optional[Dict[str, Any]]:
@@ -78,14 +91,7 @@ class PreferenceCollector:
             if (pref_value is None or
                     (pref_key == 'topics' and
                      (not pref_value or len(pref_value) == 0))):
-                question_data = self.PREFERENCE_QUESTIONS[pref_key]
-                return {
-                    'message': question_data['question'],
-                    'quick_reply_options': question_data['options'],
-                    'preference_type': pref_key,
-                    'selection_type': question_data['type'],
-                    'is_preference_question': True
-                }
+                return self._PREBUILT_QUESTIONS[pref_key]
 
         # All preferences are complete
         return None
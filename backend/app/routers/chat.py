@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from typing import AsyncGenerator
-import json
-from datetime import datetime
+from typing import AsyncGenerator, Any, Dict, List, Optional, Tuple
+import orjson
+from cachetools import TTLCache
 from ..models import ChatRequest
 from ..agent import NewsAgent
 import logging
@@ -10,12 +10,41 @@ import logging
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Store agent instances per conversation
-agents = {}
+# Store agent instances per conversation. Conversations idle for an
+# hour are evicted so the process does not grow without bound. The
+# agents live in this worker's memory: running several workers needs
+# sticky sessions (or a shared store) to keep a conversation on one.
+agents: TTLCache = TTLCache(maxsize=1000, ttl=3600)
 
 # Non-streaming endpoint removed - use /stream for all chat interactions
 
 
+def _dump_preferences(agent: NewsAgent) -> Optional[Dict[str, Any]]:
+    """Serialize the agent's current preferences for a response"""
+    return agent.preferences.model_dump() if agent.preferences else None
+
+
+def _preferences_json(agent: NewsAgent) -> Optional[orjson.Fragment]:
+    """The agent's preferences as JSON, ready to embed in an SSE event"""
+    if not agent.preferences:
+        return None
+    return orjson.Fragment(agent.preferences.model_dump_json())
+
+
+def _preferences_state(
+        agent: NewsAgent
+) -> Tuple[Optional[Dict[str, Any]], bool, List[str]]:
+    """Return the agent's preferences, whether complete, and what's missing
+
+    Completeness is derived from the missing list rather than checking
+    every field a second time.
+    """
+    if not agent.preferences:
+        return None, False, []
+    missing = agent.preferences.get_missing_preferences()
+    return _dump_preferences(agent), not missing, missing
+
+
 @router.post("/stream")
 async def chat_stream(request: ChatRequest):
     """Stream chat responses using Server-Sent Events"""
@@ -25,9 +54,11 @@ async def chat_stream(request: ChatRequest):
     )
 
     try:
-        # Get or create agent for this conversation
-        if request.conversation_id not in agents:
-            agents[request.conversation_id] = NewsAgent()
+        # Get or create agent for this conversation. Storing it again on
+        # every request makes the TTL count from the last message.
+        agent = agents.get(request.conversation_id)
+        if agent is None:
+            agent = NewsAgent()
             logger.info(
                 f"Created new agent for streaming conversation: "
                 f"{request.conversation_id}"
@@ -37,14 +68,13 @@ async def chat_stream(request: ChatRequest):
                 f"Using existing agent for streaming conversation: "
                 f"{request.conversation_id}"
             )
-
-        agent = agents[request.conversation_id]
+        agents[request.conversation_id] = agent
 
         # Update preferences if provided
         if request.preferences:
             agent.preferences = request.preferences
 
-        async def generate() -> AsyncGenerator[str, None]:
+        async def generate() -> AsyncGenerator[bytes, None]:
             try:
                 # Check if this is a preference-related message
                 # that should be handled immediately
@@ -57,24 +87,18 @@ async def chat_stream(request: ChatRequest):
                         preferences=request.preferences
                     )
 
-                    # Send complete message with quick reply options
-                    message_dict = response_message.model_dump()
-                    # Convert datetime to ISO string for JSON serialization
-                    if isinstance(message_dict.get('timestamp'), datetime):
-                        message_dict['timestamp'] = (
-                            message_dict['timestamp'].isoformat()
-                        )
-
-                    complete_data = json.dumps({
+                    # Send complete message with quick reply options.
+                    # Models are serialized straight to JSON by Pydantic
+                    # and embedded as is, without an intermediate dict.
+                    complete_data = orjson.dumps({
                         "type": "complete_message",
-                        "message": message_dict,
-                        "preferences": (
-                            agent.preferences.model_dump()
-                            if agent.preferences else None
+                        "message": orjson.Fragment(
+                            response_message.model_dump_json()
                         ),
+                        "preferences": _preferences_json(agent),
                         "conversation_id": request.conversation_id
                     })
-                    yield f"data: {complete_data}\n\n"
+                    yield b"data: " + complete_data + b"\n\n"
                     return
 
                 # Regular streaming for non-preference messages
@@ -82,30 +106,27 @@ async def chat_stream(request: ChatRequest):
                     message=request.message,
                     preferences=request.preferences
                 ):
-                    data = json.dumps({
+                    data = orjson.dumps({
                         "type": "chunk",
                         "content": chunk,
                         "conversation_id": request.conversation_id
                     })
-                    yield f"data: {data}\n\n"
+                    yield b"data: " + data + b"\n\n"
 
                 # Send final message with preferences
-                final_data = json.dumps({
+                final_data = orjson.dumps({
                     "type": "complete",
-                    "preferences": (
-                        agent.preferences.model_dump()
-                        if agent.preferences else None
-                    ),
+                    "preferences": _preferences_json(agent),
                     "conversation_id": request.conversation_id
                 })
-                yield f"data: {final_data}\n\n"
+                yield b"data: " + final_data + b"\n\n"
 
             except Exception as e:
-                error_data = json.dumps({
+                error_data = orjson.dumps({
                     "type": "error",
                     "error": str(e)
                 })
-                yield f"data: {error_data}\n\n"
+                yield b"data: " + error_data + b"\n\n"
 
         return StreamingResponse(
             generate(),
@@ -125,19 +146,13 @@ async def chat_stream(request: ChatRequest):
 @router.get("/conversations/{conversation_id}/preferences")
 async def get_preferences(conversation_id: str):
     """Get current preferences for a conversation"""
-    if conversation_id not in agents:
+    agent = agents.get(conversation_id)
+    if agent is None:
         return {"preferences": None}
 
-    agent = agents[conversation_id]
+    preferences, is_complete, missing = _preferences_state(agent)
     return {
-        "preferences": (
-            agent.preferences.model_dump() if agent.preferences else None
-        ),
-        "is_complete": (
-            agent.preferences.is_complete() if agent.preferences else False
-        ),
-        "missing": (
-            agent.preferences.get_missing_preferences()
-            if agent.preferences else []
-        )
+        "preferences": preferences,
+        "is_complete": is_complete,
+        "missing": missing
     }
\ No newline at end of file
@@ -1,11 +1,67 @@
 import os
-import requests
-from typing import List, Dict, Any
+import asyncio
+import aiohttp
+from typing import List, Dict, Any, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 import logging
+import re
+from cachetools import TTLCache
+from ..clients import get_http_session
 
 logger = logging.getLogger(__name__)
 
+# Articles shared by every conversation in this process, keyed by
+# (topic, limit, content_limit, day) and kept for 15 minutes
+_CacheKey = Tuple[str, int, int, str]
+_cache: "TTLCache[_CacheKey, List[Dict[str, Any]]]" = TTLCache(
+    maxsize=512, ttl=900
+)
+# Article text extraction. Both patterns match one whole line at a time
+# and capture it without surrounding whitespace, like line.strip().
+_FULL_STORY_MARKER = "FULL STORY"
+# Main paragraphs after the marker: over 100 characters, not a link,
+# header or bold label, no URLs, no "related"/"trending" lists
+_STORY_PARAGRAPH_RE = re.compile(
+    r"^[^\S\n]*(?=\S)"
+    r"(?!\[|#|\*\*)"
+    r"(?![^\n]*(?:http|www\.))"
+    r"(?![^\n]*(?i:related|trending))"
+    r"([^\n]{100,}?\S)[^\S\n]*$",
+    re.MULTILINE
+)
+# Fallback paragraphs: over 80 characters, not a header or link, and
+# no navigation text or URLs
+_FALLBACK_PARAGRAPH_RE = re.compile(
+    r"^[^\S\n]*(?=\S)"
+    r"(?![#\[])"
+    r"(?![^\n]*(?:Skip to content|Follow|Menu|www\.))"
+    r"([^\n]{80,}?\S)[^\S\n]*$",
+    re.MULTILINE
+)
+
+# The upstream call for each key being fetched. Concurrent identical
+# requests all await it and share its result or its exception, instead
+# of each hitting Exa.
+_inflight: Dict[_CacheKey, "asyncio.Task[List[Dict[str, Any]]]"] = {}
+
+# Upper bound on EXA requests in flight from this process, so bursts of
+# conversations and topics stay within the API's rate limit
+_exa_semaphore = asyncio.Semaphore(16)
+# Rate-limited (429) requests are retried after 0.5s, 1s, 2s
+_MAX_RETRIES = 3
+_RETRY_BASE_DELAY = 0.5
+
+
+def _forget_inflight(key: _CacheKey, task: asyncio.Task):
+    """Drop a finished upstream call so the next miss starts a new one"""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # Mark a failure as retrieved even if every caller was cancelled
+    if not task.cancelled():
+        task.exception()
+
 
 class ExaNewsFetcher:
     def __init__(self):
@@ -17,9 +73,83 @@ class ExaNewsFetcher:
                 "EXA_API_KEY environment variable is required but not found"
             )
 
-    def fetch(self, topic: str, limit: int = 5) -> List[Dict[str, Any]]:
-        """Fetch news articles from Exa API"""
+    async def fetch(
+            self, topic: str, limit: int = 5,
+            content_limit: int = 1200
+    ) -> List[Dict[str, Any]]:
+        """Fetch news articles from Exa API
+
+        Article content is truncated to content_limit characters.
+        Requests go through the process-wide HTTP session.
+        Results are cached per topic and day for a few minutes.
+        """
+        key = (
+            topic.lower(), limit, content_limit,
+            datetime.now().strftime("%Y-%m-%d")
+        )
+        articles = _cache.get(key)
+        if articles is not None:
+            logger.info(f"Serving cached articles for topic: {topic}")
+            return articles
 
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_and_cache(key, topic, limit, content_limit)
+            )
+            _inflight[key] = task
+            task.add_done_callback(
+                lambda done: _forget_inflight(key, done)
+            )
+        # Shielded so a cancelled caller does not cancel the call that
+        # other callers are waiting on
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(
+            self, key: _CacheKey, topic: str, limit: int,
+            content_limit: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch articles from Exa and store them in the cache"""
+        articles = await self._fetch_uncached(topic, limit, content_limit)
+        _cache[key] = articles
+        return articles
+
+    async def _post_search(
+            self, request_payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """POST a search to Exa, backing off while it is rate limited"""
+        session = get_http_session()
+        attempt = 0
+        while True:
+            async with _exa_semaphore:
+                async with session.post(
+                    self.base_url,
+                    headers={
+                        "x-api-key": self.api_key,
+                        "Content-Type": "application/json"
+                    },
+                    json=request_payload,
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    logger.info(
+                        f"EXA API response status: {response.status}"
+                    )
+                    if response.status != 429 or attempt == _MAX_RETRIES:
+                        response.raise_for_status()
+                        return await response.json()
+
+            # Wait outside the semaphore so other requests can proceed
+            delay = _RETRY_BASE_DELAY * 2 ** attempt
+            attempt += 1
+            logger.warning(
+                f"EXA API rate limited, retry {attempt} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    async def _fetch_uncached(
+            self, topic: str, limit: int, content_limit: int
+    ) -> List[Dict[str, Any]]:
+        """Request articles from Exa and extract their content"""
         try:
             # Calculate date range (last 7 days)
             end_date = datetime.now()
@@ -46,104 +176,16 @@ class ExaNewsFetcher:
             }
             logger.info(f"EXA API request payload: {request_payload}")
 
-            response = requests.post(
-                self.base_url,
-                headers={
-                    "x-api-key": self.api_key,
-                    "Content-Type": "application/json"
-                },
-                json=request_payload,
-                timeout=10
-            )
-            logger.info(f"EXA API response status: {response.status_code}")
-            response.raise_for_status()
+            data = await self._post_search(request_payload)
 
-            data = response.json()
             logger.info(
                 f"EXA API returned data with "
                 f"{len(data.get('results', []))} results"
             )
-            articles = []
-
-            for i, result in enumerate(data.get("results", [])):
-                # Extract meaningful article content from the text field
-                text_content = ""
-
-                if result.get("text"):
-                    full_text = result.get("text", "")
-
-                    # Extract main article content (skip navigation, etc.)
-                    # Look for "FULL STORY" marker or main paragraphs
-                    if "FULL STORY" in full_text:
-                        # ScienceDaily format - extract after "FULL STORY"
-                        content_start = full_text.find("FULL STORY")
-                        if content_start != -1:
-                            content_section = full_text[content_start + 10:]
-                            # Find the main article paragraphs
-                            paragraphs = []
-                            lines = content_section.split('\n')
-                            for line in lines:
-                                line = line.strip()
-                                # Skip navigation, links, short lines
-                                if (len(line) > 100 and
-                                        not line.startswith('[') and
-                                        not line.startswith('#') and
-                                        not line.startswith('**') and
-                                        'http' not in line and
-                                        'www.' not in line and
-                                        'RELATED' not in line.upper() and
-                                        'TRENDING' not in line.upper()):
-                                    paragraphs.append(line)
-                                    # Limit to 2-3 key paragraphs
-                                    if len(paragraphs) >= 3:
-                                        break
-                            text_content = ' '.join(paragraphs)[:1200]
-                            logger.info(
-                                f"Extracted main content for article {i+1}, "
-                                f"paragraphs: {len(paragraphs)}, "
-                                f"length: {len(text_content)}"
-                            )
-
-                    # Fallback: if no FULL STORY, extract meaningful paragraphs
-                    if not text_content:
-                        lines = full_text.split('\n')
-                        meaningful_lines = []
-                        for line in lines:
-                            line = line.strip()
-                            # Keep substantial paragraphs, skip navigation
-                            if (len(line) > 80 and
-                                    not line.startswith('#') and
-                                    not line.startswith('[') and
-                                    'Skip to content' not in line and
-                                    'Follow' not in line and
-                                    'Menu' not in line and
-                                    'www.' not in line):
-                                meaningful_lines.append(line)
-                                if len(' '.join(meaningful_lines)) > 1000:
-                                    break
-                        text_content = ' '.join(meaningful_lines)[:1200]
-                        logger.info(
-                            f"Extracted fallback content for article {i+1}, "
-                            f"length: {len(text_content)}"
-                        )
-                else:
-                    logger.warning(f"No text content found for article {i+1}")
-
-                article = {
-                    "title": result.get("title", ""),
-                    "content": text_content,
-                    "url": result.get("url", ""),
-                    "published_date": result.get(
-                        "publishedDate", result.get("published_date", "")
-                    ),
-                    "author": result.get("author", "Unknown"),
-                    "score": result.get("score", 0)
-                }
-                articles.append(article)
-                logger.info(
-                    f"Processed article {i+1}: {article['title'][:50]}... "
-                    f"(content length: {len(article['content'])})"
-                )
+            # Text extraction is CPU-bound, so keep it off the event loop
+            articles = await asyncio.to_thread(
+                self._parse_results, data, content_limit
+            )
 
             logger.info(
                 f"Successfully processed {len(articles)} articles "
@@ -151,9 +193,94 @@ class ExaNewsFetcher:
             )
             return articles
 
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error fetching news from Exa API: {e}")
             raise Exception(f"Failed to fetch news from Exa API: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in ExaNewsFetcher: {e}")
             raise Exception(f"Unexpected error in news fetching: {str(e)}")
+
+    def _parse_results(
+            self, data: Dict[str, Any], content_limit: int
+    ) -> List[Dict[str, Any]]:
+        """Turn an Exa search response into articles with extracted text"""
+        articles = []
+
+        for i, result in enumerate(data.get("results", [])):
+            # Extract meaningful article content from the text field
+            text_content = ""
+
+            if result.get("text"):
+                full_text = result.get("text", "")
+
+                # Extract main article content (skip navigation, etc.)
+                # Look for "FULL STORY" marker or main paragraphs
+                content_start = full_text.find(_FULL_STORY_MARKER)
+                if content_start != -1:
+                    # ScienceDaily format - extract after "FULL STORY"
+                    content_section = full_text[
+                        content_start + len(_FULL_STORY_MARKER):
+                    ]
+                    # Find the main article paragraphs, limited to
+                    # 2-3 key paragraphs
+                    paragraphs = [
+                        match.group(1) for match in islice(
+                            _STORY_PARAGRAPH_RE.finditer(
+                                content_section
+                            ),
+                            3
+                        )
+                    ]
+                    text_content = (
+                        ' '.join(paragraphs)[:content_limit]
+                    )
+                    logger.info(
+                        f"Extracted main content for article {i+1}, "
+                        f"paragraphs: {len(paragraphs)}, "
+                        f"length: {len(text_content)}"
+                    )
+
+                # Fallback: if no FULL STORY, extract meaningful paragraphs
+                if not text_content:
+                    meaningful_lines = []
+                    # Length of ' '.join(meaningful_lines)
+                    joined_length = -1
+                    for match in _FALLBACK_PARAGRAPH_RE.finditer(
+                            full_text):
+                        line = match.group(1)
+                        meaningful_lines.append(line)
+                        joined_length += len(line) + 1
+                        if joined_length > 1000:
+                            break
+                    text_content = (
+                        ' '.join(meaningful_lines)[:content_limit]
+                    )
+                    logger.info(
+                        f"Extracted fallback content for article {i+1}, "
+                        f"length: {len(text_content)}"
+                    )
+            else:
+                logger.warning(f"No text content found for article {i+1}")
+
+            article = {
+                "title": result.get("title", ""),
+                "content": text_content,
+                "url": result.get("url", ""),
+                "published_date": result.get(
+                    "publishedDate", result.get("published_date", "")
+                ),
+                "author": result.get("author", "Unknown"),
+                "score": result.get("score", 0)
+            }
+            articles.append(article)
+            logger.info(
+                f"Processed article {i+1}: {article['title'][:50]}... "
+                f"(content length: {len(article['content'])})"
+            )
+        return articles
+
+
+@lru_cache(maxsize=1)
+def get_exa_fetcher() -> ExaNewsFetcher:
+    """Return the news fetcher shared by every conversation"""
+    return ExaNewsFetcher()
@@ -1,19 +1,106 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from ..models import UserPreferences
-import logging
-import os
 import asyncio
+import logging
+from functools import lru_cache
 from openai import AsyncOpenAI
+from ..clients import get_openai_client
+
+if TYPE_CHECKING:
+    import tiktoken
 
 logger = logging.getLogger(__name__)
 
+_TONE_INSTRUCTIONS = {
+    "formal": "professional and formal",
+    "casual": "friendly and conversational",
+    "enthusiastic": "energetic and exciting"
+}
+_FORMAT_INSTRUCTIONS = {"bullet points": "bullet points"}
+_DETAIL_LEVELS = {"detailed": "detailed"}
+_SUMMARY_MODEL = "gpt-4-turbo-preview"
+# Each article's content is trimmed to this many tokens in the prompt,
+# or to this many characters when the tokenizer cannot be loaded
+_ARTICLE_TOKEN_LIMIT = 250
+_ARTICLE_CHAR_LIMIT = 1000
+
+# Note: NewsAgent does not call NewsSummarizer yet, so the tokenizer is
+# only loaded if something summarizes articles directly.
+_encoding: Optional["tiktoken.Encoding"] = None
+
+
+def _load_encoding() -> "tiktoken.Encoding":
+    """Load the summary model's tokenizer
+
+    Imported here so tiktoken is only needed once something is actually
+    summarized. The first load may download the BPE file.
+    """
+    import tiktoken
+    return tiktoken.encoding_for_model(_SUMMARY_MODEL)
+
+
+async def _get_encoding() -> Optional["tiktoken.Encoding"]:
+    """Return the tokenizer, loading it off the event loop on first use
+
+    Returns None if it cannot be loaded, e.g. tiktoken is not installed
+    or the BPE file cannot be downloaded without network access. The
+    load is retried on the next summary.
+    """
+    global _encoding
+    if _encoding is None:
+        try:
+            _encoding = await asyncio.to_thread(_load_encoding)
+        except Exception as e:
+            logger.warning(
+                f"Tokenizer unavailable, truncating articles by "
+                f"characters: {e}"
+            )
+    return _encoding
+
+
+def _truncate_tokens(text: str, encoding: Optional["tiktoken.Encoding"],
+                     limit: int = _ARTICLE_TOKEN_LIMIT) -> str:
+    """Trim text to at most limit tokens of the summary model"""
+    if encoding is None:
+        return text[:_ARTICLE_CHAR_LIMIT]
+    tokens = encoding.encode(text)
+    if len(tokens) <= limit:
+        return text
+    return encoding.decode(tokens[:limit])
+
+
+@lru_cache(maxsize=128)
+def _build_system_prompt(language: Optional[str], tone: Optional[str],
+                         fmt: Optional[str], style: Optional[str]) -> str:
+    """Build the summarizer system prompt for a set of preferences
+
+    Preferences only take a handful of values, so every combination is
+    built once and then served from the cache.
+    """
+    language = language or "English"
+    tone_instruction = _TONE_INSTRUCTIONS.get(tone, "neutral")
+    format_instruction = _FORMAT_INSTRUCTIONS.get(fmt, "paragraph format")
+    detail_level = _DETAIL_LEVELS.get(style, "concise")
+
+    return f"""You are a news summarizer. Create a complete news summary in {language} with the following requirements:
+
+- Write in a {tone_instruction} tone
+- Format the response in {format_instruction}
+- Provide a {detail_level} level of information
+- Language: ALL content must be in {language} (not English unless {language} is English)
+- Include relevant links and dates when available
+- Use markdown formatting for headers and links
+- Include an appropriate greeting and closing based on the {tone_instruction} tone
+- Create a complete, standalone news summary
+
+Summarize the following news articles:"""
+
 
 class NewsSummarizer:
-    def __init__(self):
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is required")
-        self.async_client = AsyncOpenAI(api_key=api_key)
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """The process-wide OpenAI client"""
+        return get_openai_client()
 
     async def summarize_async(self, articles: List[Dict[str, Any]],
                              preferences: UserPreferences) -> str:
@@ -33,53 +120,15 @@ class NewsSummarizer:
             logger.error(f"Error in OpenAI summarization: {e}")
             return f"Sorry, I encountered an error while summarizing the news: {str(e)}"
 
-    def summarize(self, articles: List[Dict[str, Any]],
-                  preferences: UserPreferences) -> str:
-        """Sync wrapper for backward compatibility"""
-        return asyncio.run(self.summarize_async(articles, preferences))
-
     async def _async_summarize(self, articles: List[Dict[str, Any]], preferences: UserPreferences) -> str:
         """Async method to summarize using OpenAI"""
-        # Prepare articles text for OpenAI
-        articles_text = ""
-        for i, article in enumerate(articles, 1):
-            title = article.get("title", "Untitled")
-            content = article.get("content", "")[:1000]  # Limit content length
-            url = article.get("url", "")
-            articles_text += f"Article {i}: {title}\nContent: {content}\nURL: {url}\n\n"
-        
-        # Build system prompt based on preferences
-        language = preferences.language or "English"
-        tone_map = {
-            "formal": "professional and formal",
-            "casual": "friendly and conversational", 
-            "enthusiastic": "energetic and exciting"
-        }
-        tone_instruction = tone_map.get(preferences.tone, "neutral")
-        
-        format_instruction = "bullet points" if preferences.format == "bullet points" else "paragraph format"
-        detail_level = "detailed" if preferences.interaction_style == "detailed" else "concise"
-        
-        system_prompt = f"""You are a news summarizer. Create a complete news summary in {language} with the following requirements:
-
-- Write in a {tone_instruction} tone
-- Format the response in {format_instruction}
-- Provide a {detail_level} level of information
-- Language: ALL content must be in {language} (not English unless {language} is English)
-- Include relevant links and dates when available
-- Use markdown formatting for headers and links
-- Include an appropriate greeting and closing based on the {tone_instruction} tone
-- Create a complete, standalone news summary
-
-Summarize the following news articles:"""
-
         try:
+            encoding = await _get_encoding()
             response = await self.async_client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": articles_text}
-                ],
+                model=_SUMMARY_MODEL,
+                messages=self._build_messages(
+                    articles, preferences, encoding
+                ),
                 temperature=0.7,
                 max_tokens=1500,
                 timeout=30.0  # 30 second timeout
@@ -93,11 +142,52 @@ Summarize the following news articles:"""
             logger.error(f"OpenAI summarization failed: {e}")
             # Return a more user-friendly error message
             return f"I'm having trouble connecting to the news service right now. Please try again in a moment."
-    
+
+    def _build_messages(
+            self, articles: List[Dict[str, Any]],
+            preferences: UserPreferences,
+            encoding: Optional["tiktoken.Encoding"]
+    ) -> List[Dict[str, str]]:
+        """Build the OpenAI messages for summarizing the articles"""
+        # Prepare articles text for OpenAI
+        parts = []
+        for i, article in enumerate(articles, 1):
+            # Leave out empty fields rather than padding the prompt
+            title = article.get("title")
+            parts.append(f"Article {i}: {title}\n" if title
+                         else f"Article {i}:\n")
+            content = article.get("content")
+            if content:
+                parts.append(
+                    f"Content: {_truncate_tokens(content, encoding)}\n"
+                )
+            url = article.get("url")
+            if url:
+                parts.append(f"URL: {url}\n")
+            parts.append("\n")
+        articles_text = "".join(parts)
+        
+        system_prompt = _build_system_prompt(
+            preferences.language,
+            preferences.tone,
+            preferences.format,
+            preferences.interaction_style
+        )
+
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": articles_text}
+        ]
 
     def apply_language_adjustments(self, summary: str,
                                    language: str) -> str:
         """Apply language-specific adjustments"""
         # Language is now handled directly by OpenAI through system prompt
         # No additional processing needed here
-        return summary
\ No newline at end of file
+        return summary
+
+
+@lru_cache(maxsize=1)
+def get_news_summarizer() -> NewsSummarizer:
+    """Return the summarizer shared by every conversation"""
+    return NewsSummarizer()